@@ -1,8 +1,385 @@
+import asyncio
+import atexit
+import contextlib
+import contextvars
 import datetime
+import functools
+import operator
 import os
-import requests
-from zoneinfo import ZoneInfo
-from google.adk.agents import Agent
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
+# httpx, redis and google.adk are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    import httpx
+    import redis
+
+_WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+_GEOCODE_URL = "https://api.openweathermap.org/geo/1.0/direct"
+_TIMEZONE_URL = "https://api.timezonedb.com/v2.1/get-time-zone"
+
+# API keys are read once at import; call refresh_keys() after changing the environment
+_WEATHER_API_KEY = os.environ.get("WEATHER_API_KEY")
+_TIMEZONE_API_KEY = os.environ.get("TIMEZONE_API_KEY")
+
+# Constant query parameters; each request only adds its city or coordinates
+_WEATHER_BASE_PARAMS = {"appid": _WEATHER_API_KEY, "units": "metric"}
+_GEOCODE_BASE_PARAMS = {"limit": 1, "appid": _WEATHER_API_KEY}
+_TZ_BASE_PARAMS = {
+    "key": _TIMEZONE_API_KEY,
+    "format": "json",
+    "by": "position",
+    "fields": "zoneName,formatted",
+}
+
+# Shared HTTP/2 client so connections are reused and multiplexed across tool calls
+_CLIENT: "httpx.Client | None" = None
+_CLIENT_LOCK = threading.Lock()
+
+# Cap in-flight API requests per client; the async tools get their own slots
+# per event loop, so this bounds concurrency, not the request rate
+_MAX_CONCURRENT_REQUESTS = 5
+_REQUEST_SLOTS = threading.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+# Token bucket for OpenWeatherMap's free tier (60 calls/minute), shared by the
+# sync and async paths; TimeZoneDB has its own limits and isn't counted
+_OWM_URLS = frozenset((_WEATHER_URL, _GEOCODE_URL))
+_OWM_CALLS_PER_PERIOD = 60
+_OWM_PERIOD = 60.0
+_OWM_TOKENS = float(_OWM_CALLS_PER_PERIOD)
+_OWM_UPDATED = time.monotonic()
+_OWM_LOCK = threading.Lock()
+
+# Async client and its request slots for the current top-level async tool call,
+# shared with the lookups it gathers (e.g. by get_city_info) and closed when the
+# call returns; both are bound to the running loop, so none outlive the call
+_ASYNC_CLIENT: "contextvars.ContextVar[tuple[httpx.AsyncClient, asyncio.Semaphore] | None]" = (
+    contextvars.ContextVar("_ASYNC_CLIENT", default=None)
+)
+
+# Cache weather reports per city to avoid repeat API calls for the same lookup
+_WEATHER_TTL = int(os.environ.get("WEATHER_TTL", "300"))
+_WEATHER_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()  # "weather:<city>" -> (expiry, conditions)
+
+# Local caches are keyed on user-supplied city strings, so bound them; in-memory
+# stores evict least recently used, the shelf evicts soonest-expiring
+_CACHE_MAXSIZE = 1024
+
+# Unknown cities are remembered briefly so typos don't hit the APIs on every retry
+_NEG_TTL = 60
+
+# City coordinates barely change, so keep them on disk across restarts
+_GEOCODE_CACHE_PATH = os.environ.get("GEOCODE_CACHE_PATH", "/tmp/geocode.db")
+_GEOCODE_TTL = 30 * 86400
+# Opened on first use; "geocode:<city>" -> (expiry, [lat, lon] | None)
+_GEOCODE_CACHE: "shelve.Shelf | OrderedDict | None" = None
+_GEOCODE_CACHE_LOCK = threading.Lock()
+# Cities the geocoder didn't find; kept out of the shelf so misses don't persist
+_GEOCODE_MISSES: "OrderedDict[str, tuple[float, None]]" = OrderedDict()
+
+# IANA zone per ~1km coordinate tile, so the current time can be computed
+# without TimeZoneDB; nearby city names geocoding into one tile share an entry
+_ZONE_TTL = 30 * 86400
+_ZONE_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()  # "tz:<tile>" -> (expiry, zone_name)
+
+_CACHE_LOCK = threading.RLock()
+
+# Optional Redis shared by all worker processes; REDIS_URL unset disables it
+_REDIS_URL = os.environ.get("REDIS_URL")
+_REDIS: "redis.Redis | None" = None
+_REDIS_LOCK = threading.Lock()
+# After a Redis error, skip Redis for this long instead of paying the
+# connect timeout on every cache read and write
+_REDIS_COOLDOWN = 30.0
+_REDIS_RETRY_AT = 0.0  # time.monotonic() before which Redis is skipped
+
+_MISSING = object()
+
+_C2F_SLOPE = 1.8  # 9/5
+
+# Field extractors for the API responses
+_get_main_and_weather = operator.itemgetter("main", "weather")
+_get_temp = operator.itemgetter("temp")
+_get_description = operator.itemgetter("description")
+_get_first = operator.itemgetter(0)
+_get_lat_lon = operator.itemgetter("lat", "lon")
+_get_time_and_zone = operator.itemgetter("formatted", "zoneName")
+
+
+def refresh_keys() -> None:
+    """Re-reads the API keys from the environment."""
+    global _WEATHER_API_KEY, _TIMEZONE_API_KEY
+    _WEATHER_API_KEY = os.environ.get("WEATHER_API_KEY")
+    _TIMEZONE_API_KEY = os.environ.get("TIMEZONE_API_KEY")
+    _WEATHER_BASE_PARAMS["appid"] = _WEATHER_API_KEY
+    _GEOCODE_BASE_PARAMS["appid"] = _WEATHER_API_KEY
+    _TZ_BASE_PARAMS["key"] = _TIMEZONE_API_KEY
+
+
+def _client_options(transport_cls: type) -> dict:
+    """Keyword arguments shared by the sync and async HTTP clients."""
+    import httpx
+
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    return {
+        "timeout": httpx.Timeout(5.0, connect=3.0),
+        # The transport owns pooling and HTTP/2, and retries failed connects
+        "transport": transport_cls(http2=True, limits=limits, retries=2),
+    }
+
+
+def _get_client() -> "httpx.Client":
+    """Returns the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                import httpx
+
+                _CLIENT = httpx.Client(**_client_options(httpx.HTTPTransport))
+    return _CLIENT
+
+
+def _reserve_call(url: str) -> float:
+    """Takes a token for an OpenWeatherMap call; returns the seconds to wait before sending it.
+
+    The bucket may go negative, so concurrent callers queue up behind each other.
+    """
+    global _OWM_TOKENS, _OWM_UPDATED
+    if url not in _OWM_URLS:
+        return 0.0
+    with _OWM_LOCK:
+        now = time.monotonic()
+        refill = (now - _OWM_UPDATED) * _OWM_CALLS_PER_PERIOD / _OWM_PERIOD
+        _OWM_TOKENS = min(float(_OWM_CALLS_PER_PERIOD), _OWM_TOKENS + refill) - 1
+        _OWM_UPDATED = now
+        if _OWM_TOKENS >= 0:
+            return 0.0
+        return -_OWM_TOKENS * _OWM_PERIOD / _OWM_CALLS_PER_PERIOD
+
+
+def _http_get(url: str, params: dict) -> "httpx.Response":
+    """GETs a URL on the shared client, waiting for the rate limit and a free request slot first."""
+    wait = _reserve_call(url)
+    if wait:
+        time.sleep(wait)
+    with _REQUEST_SLOTS:
+        return _get_client().get(url, params=params)
+
+
+def _get_geocode_cache() -> "shelve.Shelf | OrderedDict":
+    """Returns the on-disk geocode shelf, opening it on first use.
+
+    Falls back to an in-memory LRU when the shelf can't be opened, e.g. an
+    unwritable path or another worker process holding the dbm write lock.
+    """
+    global _GEOCODE_CACHE
+    if _GEOCODE_CACHE is None:
+        with _GEOCODE_CACHE_LOCK:
+            if _GEOCODE_CACHE is None:
+                import dbm
+
+                try:
+                    shelf = shelve.open(_GEOCODE_CACHE_PATH, writeback=False)
+                except (OSError, *dbm.error):
+                    _GEOCODE_CACHE = OrderedDict()
+                else:
+                    atexit.register(shelf.close)
+                    _GEOCODE_CACHE = shelf
+    return _GEOCODE_CACHE
+
+
+def _local_cache(ns: str) -> "shelve.Shelf | OrderedDict":
+    """In-process store for a cache namespace, used when Redis is not configured or unreachable."""
+    if ns == "weather":
+        return _WEATHER_CACHE
+    if ns == "tz":
+        return _ZONE_CACHE
+    if ns == "geocode-miss":
+        return _GEOCODE_MISSES
+    return _get_geocode_cache()
+
+
+def _local_get(store: "shelve.Shelf | OrderedDict", key: str):
+    """Returns a fresh value from a local store, or _MISSING; expired entries are dropped."""
+    entry = store.get(key)
+    if entry is None:
+        return _MISSING
+    if time.time() >= entry[0]:
+        del store[key]
+        return _MISSING
+    if isinstance(store, OrderedDict):
+        store.move_to_end(key)
+    return entry[1]
+
+
+def _local_set(store: "shelve.Shelf | OrderedDict", key: str, value, ttl: int) -> None:
+    store[key] = (time.time() + ttl, value)
+    if isinstance(store, OrderedDict):
+        store.move_to_end(key)
+        while len(store) > _CACHE_MAXSIZE:
+            store.popitem(last=False)
+    elif len(store) > _CACHE_MAXSIZE:
+        _prune_shelf(store)
+
+
+def _prune_shelf(shelf: "shelve.Shelf") -> None:
+    """Drops expired entries, then the soonest-expiring ones, down to 90% of the cap."""
+    now = time.time()
+    expiries = {}
+    for key in list(shelf.keys()):
+        expiry = shelf[key][0]
+        if now >= expiry:
+            del shelf[key]
+        else:
+            expiries[key] = expiry
+    excess = len(expiries) - _CACHE_MAXSIZE * 9 // 10
+    if excess > 0:
+        for key in sorted(expiries, key=expiries.get)[:excess]:
+            del shelf[key]
+
+
+def _get_redis() -> "redis.Redis | None":
+    """Returns the Redis client, or None if REDIS_URL is unset or invalid, redis isn't
+    installed, or Redis failed within the last _REDIS_COOLDOWN seconds."""
+    global _REDIS, _REDIS_URL
+    if time.monotonic() < _REDIS_RETRY_AT:
+        return None
+    if _REDIS is None and _REDIS_URL:
+        with _REDIS_LOCK:
+            if _REDIS is None and _REDIS_URL:
+                try:
+                    import redis
+                except ImportError:
+                    _REDIS_URL = None
+                    return None
+                try:
+                    _REDIS = redis.Redis.from_url(
+                        _REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5
+                    )
+                except ValueError:
+                    # Unsupported scheme or malformed URL; use the local caches
+                    _REDIS_URL = None
+                    return None
+    return _REDIS
+
+
+def _redis_failed() -> None:
+    """Falls back to the local caches until the cooldown elapses."""
+    global _REDIS_RETRY_AT
+    _REDIS_RETRY_AT = time.monotonic() + _REDIS_COOLDOWN
+
+
+def _cache_get(ns: str, key: str):
+    """Returns the cached value for key in namespace ns, or _MISSING."""
+    full_key = f"{ns}:{key}"
+    client = _get_redis()
+    if client is not None:
+        import redis
+
+        try:
+            raw = client.get(full_key)
+        except redis.RedisError:
+            _redis_failed()
+        else:
+            return _MISSING if raw is None else _json_loads(raw)
+
+    with _CACHE_LOCK:
+        return _local_get(_local_cache(ns), full_key)
+
+
+def _cache_set(ns: str, key: str, value, ttl: int) -> None:
+    """Caches a JSON-serializable value for ttl seconds, in Redis when available."""
+    if ttl <= 0:
+        # Caching disabled (e.g. WEATHER_TTL=0); Redis rejects such a setex
+        return
+    full_key = f"{ns}:{key}"
+    client = _get_redis()
+    if client is not None:
+        import redis
+
+        try:
+            client.setex(full_key, ttl, _json_dumps(value))
+            return
+        except redis.RedisError:
+            _redis_failed()
+
+    with _CACHE_LOCK:
+        _local_set(_local_cache(ns), full_key, value, ttl)
+
+
+def _cached_weather(key: str) -> dict | None:
+    conditions = _cache_get("weather", key)
+    return None if conditions is _MISSING else conditions
+
+
+def _store_weather(key: str, conditions: dict, ttl: int) -> dict:
+    _cache_set("weather", key, conditions, ttl)
+    return conditions
+
+
+def _weather_not_found(city: str) -> dict:
+    """Briefly caches that OpenWeatherMap doesn't know a city and returns the error."""
+    conditions = _store_weather(city.strip().lower(), {"status": "not_found"}, _NEG_TTL)
+    return _weather_report(city, conditions)
+
+
+def _store_conditions(city: str, data: dict) -> dict:
+    """Extracts the conditions from an OpenWeatherMap response and caches them."""
+    # Extract relevant information
+    main, weather = _get_main_and_weather(data)
+    conditions = {
+        "status": "success",
+        "temp_c": _get_temp(main),
+        "description": _get_description(_get_first(weather)),
+    }
+    return _store_weather(city.strip().lower(), conditions, _WEATHER_TTL)
+
+
+def _celsius_to_fahrenheit(temp_c: float) -> float:
+    return temp_c * _C2F_SLOPE + 32
+
+
+def _weather_report(city: str, conditions: dict, fahrenheit: bool = True) -> dict:
+    """Formats cached conditions as a new tool result for this caller's city."""
+    if conditions["status"] == "not_found":
+        return {
+            "status": "error",
+            "error_message": f"Could not find weather data for '{city}'.",
+        }
+    if conditions["status"] != "success":
+        raise ValueError(f"unexpected cached weather status {conditions['status']!r}")
+    temp_c = conditions["temp_c"]
+    report = (
+        f"The weather in {city} is {conditions['description']} with a temperature of"
+        f" {temp_c:.1f} degrees Celsius"
+    )
+    if fahrenheit:
+        report += f" ({_celsius_to_fahrenheit(temp_c):.1f} degrees Fahrenheit)"
+    return {"status": "success", "report": report + "."}
+
+
+def _cached_report(city: str, conditions: dict | None, fahrenheit: bool = True) -> dict | None:
+    """Formats a cache hit, or returns None so the caller refetches.
+
+    A malformed entry (e.g. an older schema left in Redis) counts as a miss.
+    """
+    if conditions is None:
+        return None
+    try:
+        return _weather_report(city, conditions, fahrenheit)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
 
 def get_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
@@ -13,50 +390,136 @@ def get_weather(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    # Get API key from environment variable
-    api_key = os.environ.get("WEATHER_API_KEY")
-    if not api_key:
+    return _get_weather(city, fahrenheit=True)
+
+
+def get_weather_celsius_only(city: str) -> dict:
+    """Retrieves the current weather report for a specified city, in Celsius only.
+
+    Args:
+        city (str): The name of the city for which to retrieve the weather report.
+
+    Returns:
+        dict: status and result or error msg.
+    """
+    return _get_weather(city, fahrenheit=False)
+
+
+def _get_weather(city: str, fahrenheit: bool) -> dict:
+    report = _cached_report(city, _cached_weather(city.strip().lower()), fahrenheit)
+    if report is not None:
+        return report
+
+    import httpx
+
+    if not _WEATHER_API_KEY:
         return {
             "status": "error",
             "error_message": "Weather API key not found in environment variables.",
         }
     
-    # Using OpenWeatherMap API
-    base_url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {
-        "q": city,
-        "appid": api_key,
-        "units": "metric"  # Using metric units
-    }
-    
     try:
-        response = requests.get(base_url, params=params)
+        # Using OpenWeatherMap API
+        response = _http_get(_WEATHER_URL, {**_WEATHER_BASE_PARAMS, "q": city})
+        if response.status_code == 404:
+            return _weather_not_found(city)
         response.raise_for_status()  # Raise exception for HTTP errors
         
-        data = response.json()
-        
-        # Extract relevant information
-        temp_c = data["main"]["temp"]
-        temp_f = (temp_c * 9/5) + 32
-        weather_desc = data["weather"][0]["description"]
-        
+        conditions = _store_conditions(city, _json_loads(response.content))
+        return _weather_report(city, conditions, fahrenheit)
+    except httpx.HTTPError as e:
         return {
-            "status": "success",
-            "report": (
-                f"The weather in {city} is {weather_desc} with a temperature of {temp_c:.1f} degrees"
-                f" Celsius ({temp_f:.1f} degrees Fahrenheit)."
-            ),
+            "status": "error",
+            "error_message": f"Error fetching weather for '{city}': {str(e)}",
         }
-    except requests.exceptions.RequestException as e:
+    except (KeyError, IndexError, TypeError, ValueError) as e:
         return {
             "status": "error",
-            "error_message": f"Error fetching weather for '{city}': {str(e)}",
+            "error_message": f"Error parsing weather data for '{city}': {e!r}",
         }
-    except (KeyError, IndexError) as e:
+
+
+def _cached_coords(key: str):
+    """Returns cached (lat, lon), None for a cached miss, or _MISSING if not cached."""
+    coords = _cache_get("geocode", key)
+    if coords is _MISSING:
+        return None if _cache_get("geocode-miss", key) is None else _MISSING
+    if coords is None:
+        return None
+    return coords[0], coords[1]
+
+
+def _store_coords(key: str, geocode_data: list) -> tuple[float, float] | None:
+    """Extracts coordinates from a geocoding response and caches them."""
+    if not geocode_data:
+        _cache_set("geocode-miss", key, None, _NEG_TTL)
+        return None
+        
+    # Extract coordinates
+    lat, lon = _get_lat_lon(_get_first(geocode_data))
+
+    _cache_set("geocode", key, [lat, lon], _GEOCODE_TTL)
+    return lat, lon
+
+
+def _geocode(city: str) -> tuple[float, float] | None:
+    """Looks up the coordinates of a city, using the on-disk cache when fresh.
+
+    Args:
+        city (str): The name of the city to geocode.
+
+    Returns:
+        tuple[float, float] | None: (lat, lon), or None if the city was not found.
+    """
+    key = city.strip().lower()
+    coords = _cached_coords(key)
+    if coords is not _MISSING:
+        return coords
+
+    geocode_response = _http_get(_GEOCODE_URL, {**_GEOCODE_BASE_PARAMS, "q": city})
+    geocode_response.raise_for_status()
+    
+    return _store_coords(key, _json_loads(geocode_response.content))
+
+
+def _tile_key(lat: float, lon: float) -> str:
+    return f"{round(lat, 2)},{round(lon, 2)}"
+
+
+def _cached_zone(key: str) -> str | None:
+    zone_name = _cache_get("tz", key)
+    return None if zone_name is _MISSING else zone_name
+
+
+def _local_time_result(city: str, zone_name: str) -> dict:
+    """Formats the current time in a cached zone without calling TimeZoneDB."""
+    now = datetime.datetime.now(ZoneInfo(zone_name))
+    formatted_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    report = f"The current time in {city} is {formatted_time} ({zone_name})"
+    return {"status": "success", "report": report}
+
+
+def _time_result(city: str, tile: str, timezone_data: dict) -> dict:
+    """Builds the time report from a TimeZoneDB response and caches its zone."""
+    if timezone_data["status"] != "OK":
         return {
             "status": "error",
-            "error_message": f"Error parsing weather data for '{city}': {str(e)}",
+            "error_message": f"Error fetching timezone data: {timezone_data.get('message', 'Unknown error')}",
         }
+        
+    # Use the formatted time from the API
+    formatted_time, zone_name = _get_time_and_zone(timezone_data)
+
+    # Only remember zones the local tz database can resolve
+    try:
+        ZoneInfo(zone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        pass
+    else:
+        _cache_set("tz", tile, zone_name, _ZONE_TTL)
+    
+    report = f"The current time in {city} is {formatted_time} ({zone_name})"
+    return {"status": "success", "report": report}
 
 
 def get_current_time(city: str) -> dict:
@@ -68,96 +531,275 @@ def get_current_time(city: str) -> dict:
     Returns:
         dict: status and result or error msg.
     """
-    # Get API key from environment variable
-    api_key = os.environ.get("TIMEZONE_API_KEY")
-    if not api_key:
+    import httpx
+
+    if not _TIMEZONE_API_KEY:
         return {
             "status": "error",
             "error_message": "Timezone API key not found in environment variables.",
         }
-        
-    # Using TimeZoneDB API
-    base_url = "https://api.timezonedb.com/v2.1/get-time-zone"
-    params = {
-        "key": api_key,
-        "format": "json",
-        "by": "position",
-        "fields": "zoneName,formatted",
-    }
     
     try:
         # First get coordinates for the city using OpenWeatherMap API as a geocoder
-        weather_api_key = os.environ.get("WEATHER_API_KEY")
-        if not weather_api_key:
+        if not _WEATHER_API_KEY:
             return {
                 "status": "error",
                 "error_message": "Weather API key not found in environment variables (needed for geocoding).",
             }
             
-        geocode_url = "https://api.openweathermap.org/geo/1.0/direct"
-        geocode_params = {
-            "q": city,
-            "limit": 1,
-            "appid": weather_api_key
-        }
-        
-        geocode_response = requests.get(geocode_url, params=geocode_params)
-        geocode_response.raise_for_status()
-        
-        geocode_data = geocode_response.json()
-        if not geocode_data:
+        coords = _geocode(city)
+        if coords is None:
             return {
                 "status": "error",
                 "error_message": f"Could not find location data for '{city}'.",
             }
-            
-        # Extract coordinates
-        lat = geocode_data[0]["lat"]
-        lon = geocode_data[0]["lon"]
-        
-        # Add coordinates to timezone API params
-        params["lat"] = lat
-        params["lng"] = lon
+        lat, lon = coords
+
+        tile = _tile_key(lat, lon)
+        zone_name = _cached_zone(tile)
+        if zone_name is not None:
+            return _local_time_result(city, zone_name)
         
-        # Get timezone data
-        timezone_response = requests.get(base_url, params=params)
+        # Get timezone data from TimeZoneDB API
+        timezone_response = _http_get(_TIMEZONE_URL, {**_TZ_BASE_PARAMS, "lat": lat, "lng": lon})
         timezone_response.raise_for_status()
         
-        timezone_data = timezone_response.json()
+        return _time_result(city, tile, _json_loads(timezone_response.content))
         
-        if timezone_data["status"] != "OK":
-            return {
-                "status": "error",
-                "error_message": f"Error fetching timezone data: {timezone_data.get('message', 'Unknown error')}",
-            }
-            
-        # Use the formatted time from the API
-        formatted_time = timezone_data["formatted"]
-        zone_name = timezone_data["zoneName"]
-        
-        report = f"The current time in {city} is {formatted_time} ({zone_name})"
-        return {"status": "success", "report": report}
-        
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "status": "error",
             "error_message": f"Error fetching time data for '{city}': {str(e)}",
         }
-    except (KeyError, IndexError) as e:
+    except (KeyError, IndexError, TypeError, ValueError) as e:
         return {
             "status": "error",
-            "error_message": f"Error parsing time data for '{city}': {str(e)}",
+            "error_message": f"Error parsing time data for '{city}': {e!r}",
         }
 
 
-root_agent = Agent(
-    name="weather_time_agent",
-    model="gemini-1.5-flash-8b",
-    description=(
-        "Agent to answer questions about the time and weather in a city."
-    ),
-    instruction=(
-        "You are a helpful agent who can answer user questions about the time and weather in a city."
-    ),
-    tools=[get_weather, get_current_time],
-)
+@contextlib.asynccontextmanager
+async def _async_client():
+    """Opens an async client for this context unless one is already shared."""
+    if _ASYNC_CLIENT.get() is not None:
+        yield
+        return
+    import httpx
+
+    async with httpx.AsyncClient(**_client_options(httpx.AsyncHTTPTransport)) as client:
+        # HTTP/2 multiplexes requests over few connections, so cap requests
+        # rather than connections; the semaphore belongs to this event loop
+        token = _ASYNC_CLIENT.set((client, asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)))
+        try:
+            yield
+        finally:
+            _ASYNC_CLIENT.reset(token)
+
+
+async def _async_get(url: str, params: dict) -> "httpx.Response":
+    """Async variant of _http_get; must run inside _async_client()."""
+    client, slots = _ASYNC_CLIENT.get()
+    wait = _reserve_call(url)
+    if wait:
+        await asyncio.sleep(wait)
+    async with slots:
+        return await client.get(url, params=params)
+
+
+async def get_weather_async(city: str) -> dict:
+    """Async variant of get_weather.
+
+    Args:
+        city (str): The name of the city for which to retrieve the weather report.
+
+    Returns:
+        dict: status and result or error msg.
+    """
+    # Cache reads and writes may hit Redis or the shelf, so keep them off the loop
+    cached = await asyncio.to_thread(_cached_weather, city.strip().lower())
+    report = _cached_report(city, cached)
+    if report is not None:
+        return report
+
+    import httpx
+
+    if not _WEATHER_API_KEY:
+        return {
+            "status": "error",
+            "error_message": "Weather API key not found in environment variables.",
+        }
+
+    try:
+        async with _async_client():
+            response = await _async_get(_WEATHER_URL, {**_WEATHER_BASE_PARAMS, "q": city})
+        if response.status_code == 404:
+            return await asyncio.to_thread(_weather_not_found, city)
+        response.raise_for_status()
+        conditions = await asyncio.to_thread(
+            _store_conditions, city, _json_loads(response.content)
+        )
+        return _weather_report(city, conditions)
+    except httpx.HTTPError as e:
+        return {
+            "status": "error",
+            "error_message": f"Error fetching weather for '{city}': {str(e)}",
+        }
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return {
+            "status": "error",
+            "error_message": f"Error parsing weather data for '{city}': {e!r}",
+        }
+
+
+async def _geocode_async(city: str) -> tuple[float, float] | None:
+    """Async variant of _geocode; must run inside _async_client()."""
+    key = city.strip().lower()
+    coords = await asyncio.to_thread(_cached_coords, key)
+    if coords is not _MISSING:
+        return coords
+
+    geocode_response = await _async_get(_GEOCODE_URL, {**_GEOCODE_BASE_PARAMS, "q": city})
+    geocode_response.raise_for_status()
+    return await asyncio.to_thread(
+        _store_coords, key, _json_loads(geocode_response.content)
+    )
+
+
+async def get_current_time_async(city: str) -> dict:
+    """Async variant of get_current_time.
+
+    Args:
+        city (str): The name of the city for which to retrieve the current time.
+
+    Returns:
+        dict: status and result or error msg.
+    """
+    import httpx
+
+    if not _TIMEZONE_API_KEY:
+        return {
+            "status": "error",
+            "error_message": "Timezone API key not found in environment variables.",
+        }
+    if not _WEATHER_API_KEY:
+        return {
+            "status": "error",
+            "error_message": "Weather API key not found in environment variables (needed for geocoding).",
+        }
+
+    try:
+        async with _async_client():
+            coords = await _geocode_async(city)
+            if coords is None:
+                return {
+                    "status": "error",
+                    "error_message": f"Could not find location data for '{city}'.",
+                }
+            lat, lon = coords
+
+            tile = _tile_key(lat, lon)
+            zone_name = await asyncio.to_thread(_cached_zone, tile)
+            if zone_name is not None:
+                return _local_time_result(city, zone_name)
+
+            timezone_response = await _async_get(
+                _TIMEZONE_URL, {**_TZ_BASE_PARAMS, "lat": lat, "lng": lon}
+            )
+        timezone_response.raise_for_status()
+        return await asyncio.to_thread(
+            _time_result, city, tile, _json_loads(timezone_response.content)
+        )
+    except httpx.HTTPError as e:
+        return {
+            "status": "error",
+            "error_message": f"Error fetching time data for '{city}': {str(e)}",
+        }
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return {
+            "status": "error",
+            "error_message": f"Error parsing time data for '{city}': {e!r}",
+        }
+
+
+async def get_city_info(city: str) -> dict:
+    """Retrieves both the weather report and the current time for a specified city.
+
+    The weather and time lookups run concurrently over one shared HTTP client.
+
+    Args:
+        city (str): The name of the city to report on.
+
+    Returns:
+        dict: status plus the weather and time results.
+    """
+    async with _async_client():
+        weather, current_time = await asyncio.gather(
+            get_weather_async(city), get_current_time_async(city)
+        )
+    ok = weather["status"] == "success" and current_time["status"] == "success"
+    return {
+        "status": "success" if ok else "error",
+        "weather": weather,
+        "time": current_time,
+    }
+
+
+async def get_weather_many(cities: list[str]) -> list[dict]:
+    """Retrieves the current weather report for several cities at once.
+
+    Prefer this over calling get_weather repeatedly when two or more cities are asked about.
+
+    Args:
+        cities (list[str]): The names of the cities to retrieve weather reports for.
+
+    Returns:
+        list[dict]: one status and result or error msg per city, in the order given.
+    """
+    if not cities:
+        return []
+    async with _async_client():
+        return list(await asyncio.gather(*(get_weather_async(city) for city in cities)))
+
+
+def _async_tool(fn):
+    """Wraps a blocking tool so ADK awaits it on a worker thread.
+
+    Keeps the blocking HTTP call off the event loop, so the model can keep
+    streaming and concurrent sessions' tool calls overlap.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
+def _build_root_agent():
+    from google.adk.agents import Agent
+
+    return Agent(
+        name="weather_time_agent",
+        model="gemini-1.5-flash-8b",
+        description=(
+            "Agent to answer questions about the time and weather in a city."
+        ),
+        instruction=(
+            "You are a helpful agent who can answer user questions about the time and weather in a city."
+        ),
+        tools=[
+            _async_tool(get_weather),
+            _async_tool(get_weather_celsius_only),
+            _async_tool(get_current_time),
+            get_city_info,
+            get_weather_many,
+        ],
+    )
+
+
+def __getattr__(name: str):
+    # Build root_agent on first access so importing this module stays cheap (PEP 562)
+    if name == "root_agent":
+        global root_agent
+        root_agent = _build_root_agent()
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
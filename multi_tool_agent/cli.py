@@ -3,13 +3,20 @@ Command-line interface for Multi Tool Agent
 """
 import sys
 import argparse
-import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
-from .agent import MultiToolAgent
 from .tools import registry
-from .config import config
+
+# The agent tree is imported lazily so --help and --list-tools start quickly
+if TYPE_CHECKING:
+    from .agent import MultiToolAgent
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Text output templates, bound once so each result is a single format call
+_TEXT_FMT = "Status: {status}\nTools used: {tools}\nResult: {result}".format_map
+_TASK_TEXT_FMT = "Task: {task}\nStatus: {status}\nTools used: {tools}\nResult: {result}".format_map
 
 def setup_logging(log_level: str = None) -> None:
     """
@@ -19,24 +26,29 @@ def setup_logging(log_level: str = None) -> None:
         log_level: The logging level to use
     """
     if log_level is None:
+        from .config import config
         log_level = config.get("LOG_LEVEL", "INFO")
         
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if not isinstance(numeric_level, int):
-        numeric_level = logging.INFO
+    numeric_level = logging._nameToLevel.get(log_level.upper(), logging.INFO)
         
+    handler = logging.StreamHandler()
+    handler.setFormatter(_LOG_FORMATTER)
+    # force=True so repeated calls (tests, notebooks) actually reconfigure
     logging.basicConfig(
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        level=numeric_level
+        handlers=[handler],
+        level=numeric_level,
+        force=True
     )
 
-def create_agent() -> MultiToolAgent:
+def create_agent() -> "MultiToolAgent":
     """
     Create and configure agent with all registered tools
     
     Returns:
         Configured MultiToolAgent instance
     """
+    from .agent import MultiToolAgent, Tool
+
     agent = MultiToolAgent()
     
     # Add all tools from registry
@@ -46,7 +58,6 @@ def create_agent() -> MultiToolAgent:
         tool_metadata = tool_info["metadata"]
         
         # Create Tool instance and add to agent
-        from .agent import Tool
         tool = Tool(
             name=tool_name,
             function=tool_function,
@@ -56,6 +67,31 @@ def create_agent() -> MultiToolAgent:
         
     return agent
 
+def _format_text(result: Dict[str, Any], fmt=_TEXT_FMT) -> str:
+    """Render a result for --output text"""
+    return fmt({
+        "task": result.get("task"),
+        "status": result["status"],
+        "tools": ", ".join(result["tools_used"] or ()) or "None",
+        "result": result["result"],
+    })
+
+def _format_tool_list() -> str:
+    """Render the registered tools for --list-tools and the 'tools' command"""
+    lines = ["Available tools:"]
+    for name, description in registry.get_tool_descriptions().items():
+        lines.append(f"  - {name}: {description}")
+    return "\n".join(lines)
+
+def _to_json(result: Dict[str, Any]) -> str:
+    """Serialize a result for --output json, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
 def parse_args() -> argparse.Namespace:
     """
     Parse command-line arguments
@@ -121,10 +157,7 @@ def main() -> None:
     
     # List available tools if requested
     if args.list_tools:
-        tool_descriptions = registry.get_tool_descriptions()
-        print("Available tools:")
-        for name, description in tool_descriptions.items():
-            print(f"  - {name}: {description}")
+        print(_format_tool_list())
         return
     
     # Create agent
@@ -136,39 +169,35 @@ def main() -> None:
         
         # Format and display output
         if args.output == "json":
-            print(json.dumps(result, indent=2))
+            print(_to_json(result))
         else:
-            print(f"Task: {result['task']}")
-            print(f"Status: {result['status']}")
-            print(f"Tools used: {', '.join(result['tools_used']) if result['tools_used'] else 'None'}")
-            print(f"Result: {result['result']}")
+            print(_format_text(result, _TASK_TEXT_FMT))
     else:
         # Interactive mode if no task provided
         print("Multi Tool Agent Interactive Mode")
         print("Type 'exit' or 'quit' to exit")
         print("Type 'tools' to list available tools")
         
+        # The registry doesn't change during a session, so render the list once
+        tool_list = None
         while True:
             try:
                 task = input("\nEnter task: ")
                 if task.lower() in ("exit", "quit"):
                     break
                 elif task.lower() == "tools":
-                    tool_descriptions = registry.get_tool_descriptions()
-                    print("Available tools:")
-                    for name, description in tool_descriptions.items():
-                        print(f"  - {name}: {description}")
+                    if tool_list is None:
+                        tool_list = _format_tool_list()
+                    print(tool_list)
                     continue
                     
                 result = agent.run(task)
                 
                 # Format and display output
                 if args.output == "json":
-                    print(json.dumps(result, indent=2))
+                    print(_to_json(result))
                 else:
-                    print(f"Status: {result['status']}")
-                    print(f"Tools used: {', '.join(result['tools_used']) if result['tools_used'] else 'None'}")
-                    print(f"Result: {result['result']}")
+                    print(_format_text(result))
             except KeyboardInterrupt:
                 print("\nExiting...")
                 break